@@ -68,10 +68,13 @@ class RegionMappingIndex(DataType):
         """
         conn_measure_index_list = dao.get_generic_entity("tvb.adapters.datatypes.db.graph.ConnectivityMeasureIndex",
                                                          self.fk_connectivity_gid, "fk_connectivity_gid")
+        changed_indexes = []
         for conn_measure_index in conn_measure_index_list:
             if not conn_measure_index.has_surface_mapping:
                 conn_measure_index.has_surface_mapping = True
-                dao.store_entity(conn_measure_index)
+                changed_indexes.append(conn_measure_index)
+        if changed_indexes:
+            dao.store_entities(changed_indexes)
 
 
 class RegionVolumeMappingIndex(DataTypeMatrix):
@@ -99,7 +102,10 @@ class RegionVolumeMappingIndex(DataTypeMatrix):
         """
         conn_measure_index_list = dao.get_generic_entity("tvb.adapters.datatypes.db.graph.ConnectivityMeasureIndex",
                                                          self.fk_connectivity_gid, "fk_connectivity_gid")
+        changed_indexes = []
         for conn_measure_index in conn_measure_index_list:
             if not conn_measure_index.has_volume_mapping:
                 conn_measure_index.has_volume_mapping = True
-                dao.store_entity(conn_measure_index)
+                changed_indexes.append(conn_measure_index)
+        if changed_indexes:
+            dao.store_entities(changed_indexes)
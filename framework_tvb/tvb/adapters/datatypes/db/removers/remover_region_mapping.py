@@ -56,10 +56,13 @@ class RegionMappingRemover(ABCRemover):
         others_rm_list = dao.get_generic_entity(RegionMappingIndex, conn_gid, 'fk_connectivity_gid')
         if len(others_rm_list) <= 1:
             # Only the current RegionMappingIndex is compatible
+            changed_indexes = []
             for conn_measure_index in conn_measure_list:
                 if conn_measure_index.has_surface_mapping:
                     conn_measure_index.has_surface_mapping = False
-                    dao.store_entity(conn_measure_index)
+                    changed_indexes.append(conn_measure_index)
+            if changed_indexes:
+                dao.store_entities(changed_indexes)
 
         ABCRemover.remove_datatype(self, skip_validation)
 
@@ -88,9 +91,12 @@ class RegionVolumeMappingRemover(RegionMappingRemover):
         others_rvm_list = dao.get_generic_entity(RegionVolumeMappingIndex, conn_gid, 'fk_connectivity_gid')
         if len(others_rvm_list) <= 1:
             # Only the current RegionVolumeMappingIndex is compatible
+            changed_indexes = []
             for conn_measure_index in conn_measure_list:
                 if conn_measure_index.has_volume_mapping:
                     conn_measure_index.has_volume_mapping = False
-                    dao.store_entity(conn_measure_index)
+                    changed_indexes.append(conn_measure_index)
+            if changed_indexes:
+                dao.store_entities(changed_indexes)
 
         ABCRemover.remove_datatype(self, skip_validation)
@@ -103,7 +103,7 @@ class ABCMappedArraySVGVisualizer(ABCSpaceDisplayer):
         try:
             with h5.h5_file_for_index(dtm_index) as h5_file:
                 result_2d = h5_file.array_data[slice_used]
-                result_2d = result_2d.astype(float)
+                result_2d = result_2d.astype(float, copy=False)
             if result_2d.ndim > 2:  # the slice did not produce a 2d array, treat as error
                 raise ValueError(str(dtm_index.shape))
         except (ValueError, IndexError, TypeError):  # if the slice failed to produce a 2d array
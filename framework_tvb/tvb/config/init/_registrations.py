@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#
+#
+# TheVirtualBrain-Framework Package. This package holds all Data Management, and
+# Web-UI helpful to run brain-simulations. To use it, you also need do download
+# TheVirtualBrain-Scientific Package (for simulators). See content of the
+# documentation-folder for more details. See also http://www.thevirtualbrain.org
+#
+# (c) 2012-2020, Baycrest Centre for Geriatric Care ("Baycrest") and others
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this
+# program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+#   CITATION:
+# When using The Virtual Brain for scientific publications, please cite it as follows:
+#
+#   Paula Sanz Leon, Stuart A. Knock, M. Marmaduke Woodman, Lia Domide,
+#   Jochen Mersmann, Anthony R. McIntosh, Viktor Jirsa (2013)
+#       The Virtual Brain: a simulator of primate brain network dynamics.
+#   Frontiers in Neuroinformatics (7:10. doi: 10.3389/fninf.2013.00010)
+#
+#
+"""
+Declarative table of the (datatype, H5File, Index) triples known to the framework.
+Kept apart from datatypes_registry, which only imports it when the registry is actually populated.
+"""
+import importlib
+import sys
+from tvb.basic.logger.builder import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Datatype, H5File and Index classes are imported on first access (PEP 562), so that even this table
+# stays cheap to import. Each module is imported once, and all the names it provides are bound together
+_SYMBOLS_BY_MODULE = {
+    'tvb.core.entities.file.simulator.burst_configuration_h5': ('BurstConfigurationH5',),
+    'tvb.core.entities.model.model_burst': ('BurstConfiguration',),
+    'tvb.datatypes.connectivity': ('Connectivity',),
+    'tvb.datatypes.fcd': ('Fcd',),
+    'tvb.datatypes.graph': ('ConnectivityMeasure', 'CorrelationCoefficients', 'Covariance'),
+    'tvb.datatypes.local_connectivity': ('LocalConnectivity',),
+    'tvb.datatypes.mode_decompositions': ('PrincipalComponents', 'IndependentComponents'),
+    'tvb.datatypes.patterns': ('StimuliRegion', 'StimuliSurface', 'SpatioTemporalPattern'),
+    'tvb.datatypes.projections': ('ProjectionMatrix', 'make_proj_matrix'),
+    'tvb.datatypes.region_mapping': ('RegionVolumeMapping', 'RegionMapping'),
+    'tvb.datatypes.sensors': ('Sensors', 'make_sensors'),
+    'tvb.datatypes.spectral': (
+        'CoherenceSpectrum', 'ComplexCoherenceSpectrum', 'FourierSpectrum', 'WaveletCoefficients',
+    ),
+    'tvb.datatypes.structural': ('StructuralMRI',),
+    'tvb.datatypes.surfaces': ('Surface', 'make_surface'),
+    'tvb.datatypes.temporal_correlations': ('CrossCorrelation',),
+    'tvb.datatypes.time_series': (
+        'TimeSeries', 'TimeSeriesRegion', 'TimeSeriesSurface', 'TimeSeriesVolume', 'TimeSeriesEEG', 'TimeSeriesMEG',
+        'TimeSeriesSEEG',
+    ),
+    'tvb.datatypes.tracts': ('Tracts',),
+    'tvb.datatypes.volumes': ('Volume',),
+    'tvb.core.entities.file.simulator.simulation_history_h5': ('SimulationHistoryH5', 'SimulationHistory'),
+    'tvb.adapters.datatypes.h5.annotation_h5': ('ConnectivityAnnotationsH5', 'ConnectivityAnnotations'),
+    'tvb.adapters.datatypes.h5.connectivity_h5': ('ConnectivityH5',),
+    'tvb.adapters.datatypes.h5.fcd_h5': ('FcdH5',),
+    'tvb.adapters.datatypes.h5.graph_h5': ('ConnectivityMeasureH5', 'CorrelationCoefficientsH5', 'CovarianceH5'),
+    'tvb.adapters.datatypes.h5.local_connectivity_h5': ('LocalConnectivityH5',),
+    'tvb.adapters.datatypes.h5.mapped_value_h5': ('ValueWrapperH5', 'ValueWrapper'),
+    'tvb.core.entities.file.simulator.datatype_measure_h5': ('DatatypeMeasureH5', 'DatatypeMeasure'),
+    'tvb.adapters.datatypes.h5.mode_decompositions_h5': ('PrincipalComponentsH5', 'IndependentComponentsH5'),
+    'tvb.adapters.datatypes.h5.patterns_h5': ('StimuliRegionH5', 'StimuliSurfaceH5'),
+    'tvb.adapters.datatypes.h5.projections_h5': ('ProjectionMatrixH5',),
+    'tvb.adapters.datatypes.h5.region_mapping_h5': ('RegionMappingH5', 'RegionVolumeMappingH5'),
+    'tvb.adapters.datatypes.h5.sensors_h5': ('SensorsH5',),
+    'tvb.adapters.datatypes.h5.spectral_h5': (
+        'CoherenceSpectrumH5', 'ComplexCoherenceSpectrumH5', 'FourierSpectrumH5', 'WaveletCoefficientsH5',
+    ),
+    'tvb.adapters.datatypes.h5.structural_h5': ('StructuralMRIH5',),
+    'tvb.adapters.datatypes.h5.surface_h5': ('SurfaceH5',),
+    'tvb.adapters.datatypes.h5.temporal_correlations_h5': ('CrossCorrelationH5',),
+    'tvb.adapters.datatypes.h5.time_series_h5': (
+        'TimeSeriesH5', 'TimeSeriesRegionH5', 'TimeSeriesSurfaceH5', 'TimeSeriesVolumeH5', 'TimeSeriesEEGH5',
+        'TimeSeriesMEGH5', 'TimeSeriesSEEGH5',
+    ),
+    'tvb.adapters.datatypes.h5.tracts_h5': ('TractsH5',),
+    'tvb.adapters.datatypes.h5.volumes_h5': ('VolumeH5',),
+    'tvb.adapters.datatypes.db.annotation': ('ConnectivityAnnotationsIndex',),
+    'tvb.adapters.datatypes.db.connectivity': ('ConnectivityIndex',),
+    'tvb.adapters.datatypes.db.fcd': ('FcdIndex',),
+    'tvb.adapters.datatypes.db.graph': ('ConnectivityMeasureIndex', 'CorrelationCoefficientsIndex', 'CovarianceIndex'),
+    'tvb.adapters.datatypes.db.local_connectivity': ('LocalConnectivityIndex',),
+    'tvb.adapters.datatypes.db.mapped_value': ('DatatypeMeasureIndex', 'ValueWrapperIndex'),
+    'tvb.adapters.datatypes.db.mode_decompositions': ('PrincipalComponentsIndex', 'IndependentComponentsIndex'),
+    'tvb.adapters.datatypes.db.patterns': ('StimuliRegionIndex', 'StimuliSurfaceIndex', 'SpatioTemporalPatternIndex'),
+    'tvb.adapters.datatypes.db.projections': ('ProjectionMatrixIndex',),
+    'tvb.adapters.datatypes.db.region_mapping': ('RegionVolumeMappingIndex', 'RegionMappingIndex'),
+    'tvb.adapters.datatypes.db.sensors': ('SensorsIndex',),
+    'tvb.adapters.datatypes.db.simulation_history': ('SimulationHistoryIndex',),
+    'tvb.adapters.datatypes.db.spectral': (
+        'CoherenceSpectrumIndex', 'ComplexCoherenceSpectrumIndex', 'FourierSpectrumIndex', 'WaveletCoefficientsIndex',
+    ),
+    'tvb.adapters.datatypes.db.structural': ('StructuralMRIIndex',),
+    'tvb.adapters.datatypes.db.surface': ('SurfaceIndex',),
+    'tvb.adapters.datatypes.db.temporal_correlations': ('CrossCorrelationIndex',),
+    'tvb.adapters.datatypes.db.time_series': (
+        'TimeSeriesIndex', 'TimeSeriesRegionIndex', 'TimeSeriesSurfaceIndex', 'TimeSeriesVolumeIndex',
+        'TimeSeriesEEGIndex', 'TimeSeriesMEGIndex', 'TimeSeriesSEEGIndex',
+    ),
+    'tvb.adapters.datatypes.db.tracts': ('TractsIndex',),
+    'tvb.adapters.datatypes.db.volume': ('VolumeIndex',),
+}
+
+# (datatype, H5File, Index[, subtype factory]) names, resolved through __getattr__ at registration time
+_CORE_REGISTRATIONS = (
+    ('Connectivity', 'ConnectivityH5', 'ConnectivityIndex'),
+    (None, 'BurstConfigurationH5', 'BurstConfiguration'),
+    ('LocalConnectivity', 'LocalConnectivityH5', 'LocalConnectivityIndex'),
+    ('ProjectionMatrix', 'ProjectionMatrixH5', 'ProjectionMatrixIndex', 'make_proj_matrix'),
+    ('RegionVolumeMapping', 'RegionVolumeMappingH5', 'RegionVolumeMappingIndex'),
+    ('RegionMapping', 'RegionMappingH5', 'RegionMappingIndex'),
+    ('Sensors', 'SensorsH5', 'SensorsIndex', 'make_sensors'),
+    ('SimulationHistory', 'SimulationHistoryH5', 'SimulationHistoryIndex'),
+    ('CoherenceSpectrum', 'CoherenceSpectrumH5', 'CoherenceSpectrumIndex'),
+    ('ComplexCoherenceSpectrum', 'ComplexCoherenceSpectrumH5', 'ComplexCoherenceSpectrumIndex'),
+    ('FourierSpectrum', 'FourierSpectrumH5', 'FourierSpectrumIndex'),
+    ('WaveletCoefficients', 'WaveletCoefficientsH5', 'WaveletCoefficientsIndex'),
+    ('StructuralMRI', 'StructuralMRIH5', 'StructuralMRIIndex'),
+    ('Surface', 'SurfaceH5', 'SurfaceIndex', 'make_surface'),
+    ('CrossCorrelation', 'CrossCorrelationH5', 'CrossCorrelationIndex'),
+    ('TimeSeries', 'TimeSeriesH5', 'TimeSeriesIndex'),
+    ('TimeSeriesRegion', 'TimeSeriesRegionH5', 'TimeSeriesRegionIndex'),
+    ('TimeSeriesSurface', 'TimeSeriesSurfaceH5', 'TimeSeriesSurfaceIndex'),
+    ('TimeSeriesVolume', 'TimeSeriesVolumeH5', 'TimeSeriesVolumeIndex'),
+    ('TimeSeriesEEG', 'TimeSeriesEEGH5', 'TimeSeriesEEGIndex'),
+    ('TimeSeriesMEG', 'TimeSeriesMEGH5', 'TimeSeriesMEGIndex'),
+    ('TimeSeriesSEEG', 'TimeSeriesSEEGH5', 'TimeSeriesSEEGIndex'),
+    ('Tracts', 'TractsH5', 'TractsIndex'),
+    ('Volume', 'VolumeH5', 'VolumeIndex'),
+    ('PrincipalComponents', 'PrincipalComponentsH5', 'PrincipalComponentsIndex'),
+    ('IndependentComponents', 'IndependentComponentsH5', 'IndependentComponentsIndex'),
+    ('ConnectivityMeasure', 'ConnectivityMeasureH5', 'ConnectivityMeasureIndex'),
+    ('CorrelationCoefficients', 'CorrelationCoefficientsH5', 'CorrelationCoefficientsIndex'),
+    ('Covariance', 'CovarianceH5', 'CovarianceIndex'),
+    ('Fcd', 'FcdH5', 'FcdIndex'),
+    ('SpatioTemporalPattern', None, 'SpatioTemporalPatternIndex'),
+    ('StimuliRegion', 'StimuliRegionH5', 'StimuliRegionIndex'),
+    ('StimuliSurface', 'StimuliSurfaceH5', 'StimuliSurfaceIndex'),
+)
+
+# measures, annotations and wrapped values are not needed by the core datatypes, so a failure to import them
+# should not prevent the rest of the registry from being populated
+_OPTIONAL_REGISTRATIONS = (
+    ('DatatypeMeasure', 'DatatypeMeasureH5', 'DatatypeMeasureIndex'),
+    ('ConnectivityAnnotations', 'ConnectivityAnnotationsH5', 'ConnectivityAnnotationsIndex'),
+    ('ValueWrapper', 'ValueWrapperH5', 'ValueWrapperIndex'),
+)
+
+
+_MODULE_FOR_SYMBOL = {symbol: module_name for module_name, symbols in _SYMBOLS_BY_MODULE.items()
+                      for symbol in symbols}
+
+
+def __getattr__(name):
+    module_name = _MODULE_FOR_SYMBOL.get(name)
+    if module_name is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    module = importlib.import_module(module_name)
+    globals().update((symbol, getattr(module, symbol)) for symbol in _SYMBOLS_BY_MODULE[module_name])
+    return globals()[name]
+
+
+def resolve_registrations():
+    """
+    :return: the registration rows, with every class name replaced by the class itself
+    """
+    # attribute access on the module object goes through __getattr__ for names not yet imported
+    module = sys.modules[__name__]
+    registrations = [[None if name is None else getattr(module, name) for name in registration]
+                     for registration in _CORE_REGISTRATIONS]
+    for registration in _OPTIONAL_REGISTRATIONS:
+        try:
+            registrations.append([None if name is None else getattr(module, name) for name in registration])
+        except ImportError as excep:
+            LOGGER.warning("Skipping registration of %s: %s" % (registration[0], excep))
+    return registrations
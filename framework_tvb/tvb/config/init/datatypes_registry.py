@@ -27,111 +27,31 @@
 #   Frontiers in Neuroinformatics (7:10. doi: 10.3389/fninf.2013.00010)
 #
 #
-from tvb.core.entities.file.simulator.burst_configuration_h5 import BurstConfigurationH5
-from tvb.core.entities.model.model_burst import BurstConfiguration
-from tvb.datatypes.connectivity import Connectivity
-from tvb.datatypes.fcd import Fcd
-from tvb.datatypes.graph import ConnectivityMeasure, CorrelationCoefficients, Covariance
-from tvb.datatypes.local_connectivity import LocalConnectivity
-from tvb.datatypes.mode_decompositions import PrincipalComponents, IndependentComponents
-from tvb.datatypes.patterns import StimuliRegion, StimuliSurface, SpatioTemporalPattern
-from tvb.datatypes.projections import ProjectionMatrix, make_proj_matrix
-from tvb.datatypes.region_mapping import RegionVolumeMapping, RegionMapping
-from tvb.datatypes.sensors import Sensors, make_sensors
-from tvb.datatypes.spectral import CoherenceSpectrum, ComplexCoherenceSpectrum, FourierSpectrum, WaveletCoefficients
-from tvb.datatypes.structural import StructuralMRI
-from tvb.datatypes.surfaces import Surface, make_surface
-from tvb.datatypes.temporal_correlations import CrossCorrelation
-from tvb.datatypes.time_series import TimeSeries, TimeSeriesRegion, TimeSeriesSurface, TimeSeriesVolume
-from tvb.datatypes.time_series import TimeSeriesEEG, TimeSeriesMEG, TimeSeriesSEEG
-from tvb.datatypes.tracts import Tracts
-from tvb.datatypes.volumes import Volume
-from tvb.core.entities.file.simulator.simulation_history_h5 import SimulationHistoryH5, SimulationHistory
-from tvb.adapters.datatypes.h5.annotation_h5 import ConnectivityAnnotationsH5, ConnectivityAnnotations
-from tvb.adapters.datatypes.h5.connectivity_h5 import ConnectivityH5
-from tvb.adapters.datatypes.h5.fcd_h5 import FcdH5
-from tvb.adapters.datatypes.h5.graph_h5 import ConnectivityMeasureH5, CorrelationCoefficientsH5, CovarianceH5
-from tvb.adapters.datatypes.h5.local_connectivity_h5 import LocalConnectivityH5
-from tvb.adapters.datatypes.h5.mapped_value_h5 import ValueWrapperH5, ValueWrapper
-from tvb.core.entities.file.simulator.datatype_measure_h5 import DatatypeMeasureH5, DatatypeMeasure
-from tvb.adapters.datatypes.h5.mode_decompositions_h5 import PrincipalComponentsH5, IndependentComponentsH5
-from tvb.adapters.datatypes.h5.patterns_h5 import StimuliRegionH5, StimuliSurfaceH5
-from tvb.adapters.datatypes.h5.projections_h5 import ProjectionMatrixH5
-from tvb.adapters.datatypes.h5.region_mapping_h5 import RegionMappingH5, RegionVolumeMappingH5
-from tvb.adapters.datatypes.h5.sensors_h5 import SensorsH5
-from tvb.adapters.datatypes.h5.spectral_h5 import CoherenceSpectrumH5, ComplexCoherenceSpectrumH5
-from tvb.adapters.datatypes.h5.spectral_h5 import FourierSpectrumH5, WaveletCoefficientsH5
-from tvb.adapters.datatypes.h5.structural_h5 import StructuralMRIH5
-from tvb.adapters.datatypes.h5.surface_h5 import SurfaceH5
-from tvb.adapters.datatypes.h5.temporal_correlations_h5 import CrossCorrelationH5
-from tvb.adapters.datatypes.h5.time_series_h5 import TimeSeriesH5, TimeSeriesRegionH5, TimeSeriesSurfaceH5
-from tvb.adapters.datatypes.h5.time_series_h5 import TimeSeriesVolumeH5, TimeSeriesEEGH5, TimeSeriesMEGH5
-from tvb.adapters.datatypes.h5.time_series_h5 import TimeSeriesSEEGH5
-from tvb.adapters.datatypes.h5.tracts_h5 import TractsH5
-from tvb.adapters.datatypes.h5.volumes_h5 import VolumeH5
-from tvb.adapters.datatypes.db.annotation import ConnectivityAnnotationsIndex
-from tvb.adapters.datatypes.db.connectivity import ConnectivityIndex
-from tvb.adapters.datatypes.db.fcd import FcdIndex
-from tvb.adapters.datatypes.db.graph import ConnectivityMeasureIndex, CorrelationCoefficientsIndex
-from tvb.adapters.datatypes.db.graph import CovarianceIndex
-from tvb.adapters.datatypes.db.local_connectivity import LocalConnectivityIndex
-from tvb.adapters.datatypes.db.mapped_value import DatatypeMeasureIndex, ValueWrapperIndex
-from tvb.adapters.datatypes.db.mode_decompositions import PrincipalComponentsIndex, IndependentComponentsIndex
-from tvb.adapters.datatypes.db.patterns import StimuliRegionIndex, StimuliSurfaceIndex, SpatioTemporalPatternIndex
-from tvb.adapters.datatypes.db.projections import ProjectionMatrixIndex
-from tvb.adapters.datatypes.db.region_mapping import RegionVolumeMappingIndex, RegionMappingIndex
-from tvb.adapters.datatypes.db.sensors import SensorsIndex
-from tvb.adapters.datatypes.db.simulation_history import SimulationHistoryIndex
-from tvb.adapters.datatypes.db.spectral import CoherenceSpectrumIndex, ComplexCoherenceSpectrumIndex
-from tvb.adapters.datatypes.db.spectral import FourierSpectrumIndex, WaveletCoefficientsIndex
-from tvb.adapters.datatypes.db.structural import StructuralMRIIndex
-from tvb.adapters.datatypes.db.surface import SurfaceIndex
-from tvb.adapters.datatypes.db.temporal_correlations import CrossCorrelationIndex
-from tvb.adapters.datatypes.db.time_series import TimeSeriesIndex, TimeSeriesRegionIndex, TimeSeriesSurfaceIndex
-from tvb.adapters.datatypes.db.time_series import TimeSeriesVolumeIndex, TimeSeriesEEGIndex, TimeSeriesMEGIndex
-from tvb.adapters.datatypes.db.time_series import TimeSeriesSEEGIndex
-from tvb.adapters.datatypes.db.tracts import TractsIndex
-from tvb.adapters.datatypes.db.volume import VolumeIndex
+"""
+Entry point that fills the global REGISTRY with the known (datatype, H5File, Index) triples.
 
-from tvb.core.neocom.h5 import REGISTRY
+Importing this module has no side effects and imports nothing else: the registration table,
+the datatype classes and REGISTRY itself are only resolved when populate_datatypes_registry is called.
+"""
+
+__all__ = ['populate_datatypes_registry']
+
+_POPULATED = False
 
 
 # an alternative approach is to make each h5file declare if it has a corresponding datatype
 # then in a metaclass hook each class creation and populate a map
-def populate_datatypes_registry():
-    REGISTRY.register_datatype(Connectivity, ConnectivityH5, ConnectivityIndex)
-    REGISTRY.register_datatype(None, BurstConfigurationH5, BurstConfiguration)
-    REGISTRY.register_datatype(LocalConnectivity, LocalConnectivityH5, LocalConnectivityIndex)
-    REGISTRY.register_datatype(ProjectionMatrix, ProjectionMatrixH5, ProjectionMatrixIndex, make_proj_matrix)
-    REGISTRY.register_datatype(RegionVolumeMapping, RegionVolumeMappingH5, RegionVolumeMappingIndex)
-    REGISTRY.register_datatype(RegionMapping, RegionMappingH5, RegionMappingIndex)
-    REGISTRY.register_datatype(Sensors, SensorsH5, SensorsIndex, make_sensors)
-    REGISTRY.register_datatype(SimulationHistory, SimulationHistoryH5, SimulationHistoryIndex)
-    REGISTRY.register_datatype(CoherenceSpectrum, CoherenceSpectrumH5, CoherenceSpectrumIndex)
-    REGISTRY.register_datatype(ComplexCoherenceSpectrum, ComplexCoherenceSpectrumH5, ComplexCoherenceSpectrumIndex)
-    REGISTRY.register_datatype(FourierSpectrum, FourierSpectrumH5, FourierSpectrumIndex)
-    REGISTRY.register_datatype(WaveletCoefficients, WaveletCoefficientsH5, WaveletCoefficientsIndex)
-    REGISTRY.register_datatype(StructuralMRI, StructuralMRIH5, StructuralMRIIndex)
-    REGISTRY.register_datatype(Surface, SurfaceH5, SurfaceIndex, make_surface)
-    REGISTRY.register_datatype(CrossCorrelation, CrossCorrelationH5, CrossCorrelationIndex)
-    REGISTRY.register_datatype(TimeSeries, TimeSeriesH5, TimeSeriesIndex)
-    REGISTRY.register_datatype(TimeSeriesRegion, TimeSeriesRegionH5, TimeSeriesRegionIndex)
-    REGISTRY.register_datatype(TimeSeriesSurface, TimeSeriesSurfaceH5, TimeSeriesSurfaceIndex)
-    REGISTRY.register_datatype(TimeSeriesVolume, TimeSeriesVolumeH5, TimeSeriesVolumeIndex)
-    REGISTRY.register_datatype(TimeSeriesEEG, TimeSeriesEEGH5, TimeSeriesEEGIndex)
-    REGISTRY.register_datatype(TimeSeriesMEG, TimeSeriesMEGH5, TimeSeriesMEGIndex)
-    REGISTRY.register_datatype(TimeSeriesSEEG, TimeSeriesSEEGH5, TimeSeriesSEEGIndex)
-    REGISTRY.register_datatype(Tracts, TractsH5, TractsIndex)
-    REGISTRY.register_datatype(Volume, VolumeH5, VolumeIndex)
-    REGISTRY.register_datatype(PrincipalComponents, PrincipalComponentsH5, PrincipalComponentsIndex)
-    REGISTRY.register_datatype(IndependentComponents, IndependentComponentsH5, IndependentComponentsIndex)
-    REGISTRY.register_datatype(ConnectivityMeasure, ConnectivityMeasureH5, ConnectivityMeasureIndex)
-    REGISTRY.register_datatype(CorrelationCoefficients, CorrelationCoefficientsH5, CorrelationCoefficientsIndex)
-    REGISTRY.register_datatype(Covariance, CovarianceH5, CovarianceIndex)
-    REGISTRY.register_datatype(Fcd, FcdH5, FcdIndex)
-    REGISTRY.register_datatype(SpatioTemporalPattern, None, SpatioTemporalPatternIndex)
-    REGISTRY.register_datatype(StimuliRegion, StimuliRegionH5, StimuliRegionIndex)
-    REGISTRY.register_datatype(StimuliSurface, StimuliSurfaceH5, StimuliSurfaceIndex)
-    REGISTRY.register_datatype(DatatypeMeasure, DatatypeMeasureH5, DatatypeMeasureIndex)
-    REGISTRY.register_datatype(ConnectivityAnnotations, ConnectivityAnnotationsH5, ConnectivityAnnotationsIndex)
-    REGISTRY.register_datatype(ValueWrapper, ValueWrapperH5, ValueWrapperIndex)
+def populate_datatypes_registry(force=False):
+    """
+    Fill REGISTRY with the known datatypes. Subsequent calls are no-ops, unless force is given,
+    in which case the registry is cleared and populated again.
+    """
+    global _POPULATED
+    if _POPULATED and not force:
+        return
+    from tvb.config.init._registrations import resolve_registrations
+    from tvb.core.neocom.h5 import REGISTRY
+    if force:
+        REGISTRY.clear()
+    REGISTRY.register_many(resolve_registrations())
+    _POPULATED = True
@@ -111,11 +111,12 @@ class FilesUpdateManager(UpdateManager):
         False, the the file is already up to date.
 
         """
-        if self.is_file_up_to_date(input_file_name):
+        # read the version once, instead of opening the file again after the up-to-date check
+        file_version = self.get_file_data_version(input_file_name)
+        if file_version == TvbProfile.current.version.DATA_VERSION:
             # Avoid running the DB update of size, when H5 is not being changed, to speed-up
             return False
 
-        file_version = self.get_file_data_version(input_file_name)
         self.log.info("Updating from version %s , file: %s " % (file_version, input_file_name))
         for script_name in self.get_update_scripts(file_version):
             self.run_update_script(script_name, input_file=input_file_name)
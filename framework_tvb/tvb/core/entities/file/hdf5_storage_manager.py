@@ -68,6 +68,10 @@ class HDF5StorageManager(object):
     DATETIME_VALUE_PREFIX = "datetime:"
     DATE_TIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
     LOCKS = {}
+    # Raw data chunk cache, per opened dataset. The HDF5 default of 1MB is smaller than
+    # a single chunk of most growing TimeSeries, which forces chunks to be re-read on every slice.
+    CHUNK_CACHE_SIZE = 16 * 1024 * 1024
+    CHUNK_CACHE_SLOTS = 10007
 
     def __init__(self, storage_folder, file_name, buffer_size=600000):
         """
@@ -225,9 +229,9 @@ class HDF5StorageManager(object):
                     result = data_array[()]
                     if isinstance(result, hdf5.Empty):
                         return numpy.empty([])
-                    return result
+                    return self._decode_strings(data_array, result)
                 else:
-                    return data_array[data_slice]
+                    return self._decode_strings(data_array, data_array[data_slice])
             else:
                 if not ignore_errors:
                     LOG.error("Trying to read data from a missing data set: %s" % dataset_name)
@@ -547,7 +551,8 @@ class HDF5StorageManager(object):
                     mode = 'w'
 
                 LOG.debug("Opening file: %s in mode: %s" % (self.__storage_full_name, mode))
-                self.__hfd5_file = hdf5.File(self.__storage_full_name, mode, libver='latest')
+                self.__hfd5_file = hdf5.File(self.__storage_full_name, mode, libver='latest',
+                                             rdcc_nbytes=self.CHUNK_CACHE_SIZE, rdcc_nslots=self.CHUNK_CACHE_SLOTS)
 
                 # If this is the first time we access file, write data version
                 if not file_exists:
@@ -560,6 +565,18 @@ class HDF5StorageManager(object):
 
         return self.__hfd5_file
 
+    @staticmethod
+    def _decode_strings(dataset, data):
+        """
+        Variable length string datasets (e.g. labels) are read by h5py 3 as object arrays of bytes.
+        Decode them into a numpy unicode array, in one vectorized call instead of element by element.
+        Data read from any other kind of dataset is returned untouched.
+        """
+        string_info = hdf5.check_string_dtype(dataset.dtype)
+        if string_info is None or string_info.length is not None or not isinstance(data, numpy.ndarray):
+            return data
+        return numpy.char.decode(data.astype(bytes), string_info.encoding)
+
     @staticmethod
     def _check_data(data_list):
         """
@@ -53,6 +53,8 @@ class DatatypeDAO(RootDAO):
     """
     DATATYPE and DATA_TYPES_GROUPS RELATED METHODS
     """
+    # Keep IN clauses under the default SQLite limit of bound parameters
+    GIDS_PER_QUERY = 500
 
 
     def get_datatypegroup_by_op_group_id(self, operation_group_id):
@@ -409,6 +411,43 @@ class DatatypeDAO(RootDAO):
         return None
 
 
+    def get_datatypes_by_gids(self, gids):
+        """
+        Retrieve the specific DataType DB references for multiple global identifiers.
+        Needs one query for the generic rows and one per distinct DataType class,
+        instead of the two queries per GID needed when calling get_datatype_by_gid in a loop.
+
+        :returns: a dictionary {gid: DataType subclass instance}. GIDs not found in DB are skipped.
+        """
+        result = {}
+        gids = list(set(gids))
+        gids_per_class = {}
+        try:
+            for start in range(0, len(gids), self.GIDS_PER_QUERY):
+                rows = self.session.query(DataType.gid, DataType.module, DataType.type
+                                          ).filter(DataType.gid.in_(gids[start:start + self.GIDS_PER_QUERY])).all()
+                for gid, module, classname in rows:
+                    gids_per_class.setdefault((module, classname), []).append(gid)
+        except Exception as excep:
+            self.logger.exception(excep)
+            return result
+
+        for (module, classname), class_gids in gids_per_class.items():
+            # A class which can no longer be loaded should only hide its own DataTypes
+            try:
+                data_type = getattr(importlib.import_module(module), classname)
+                for start in range(0, len(class_gids), self.GIDS_PER_QUERY):
+                    query = self.session.query(data_type
+                                               ).filter(data_type.gid.in_(class_gids[start:start + self.GIDS_PER_QUERY]))
+                    for datatype_instance in query.all():
+                        result[datatype_instance.gid] = datatype_instance
+            except Exception as excep:
+                self.logger.warning("Could not load DataTypes of class %s.%s" % (module, classname))
+                self.logger.exception(excep)
+                continue
+        return result
+
+
     def get_links_for_datatype(self, data_id):
         """Get the links to a specific datatype"""
         try:
@@ -95,9 +95,11 @@ class DirLoader(object):
 
     def _locate(self, gid):
         # type: (uuid.UUID) -> str
-        for fname in os.listdir(self.base_dir):
-            if fname.endswith(gid.hex + H5_EXTENSION):
-                return fname
+        suffix = gid.hex + H5_EXTENSION
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix):
+                    return entry.name
         raise IOError('could not locate h5 with gid {}'.format(gid))
 
     def find_file_name(self, gid):
@@ -182,9 +184,10 @@ class DirLoader(object):
     def find_file_for_has_traits_type(self, has_traits_class):
 
         filename_prefix = self._get_has_traits_classname(has_traits_class)
-        for fname in os.listdir(self.base_dir):
-            if fname.startswith(filename_prefix) and fname.endswith(H5_EXTENSION):
-                return fname
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(filename_prefix) and entry.name.endswith(H5_EXTENSION):
+                    return entry.name
         raise IOError('could not locate h5 for {}'.format(has_traits_class.__name__))
 
 
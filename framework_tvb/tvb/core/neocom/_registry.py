@@ -28,6 +28,7 @@
 #
 #
 
+import functools
 import typing
 
 from tvb.basic.neotraits.api import HasTraits
@@ -50,15 +51,37 @@ class Registry(object):
         self._datatype_for_index = {}
         self._index_for_h5file = {}
         self._index_to_subtype_factory = {}
+        # answers of the __bases__ fallback, keyed by the exact class asked for
+        self._h5file_for_subclass = {}
+        self._index_for_subclass = {}
+        # building a throw-away instance to learn its class is costly on the load path, so memoize it
+        self._subtype_class = functools.lru_cache(maxsize=256)(self._build_subtype_class)
+
+    def _build_subtype_class(self, index_class, subtype):
+        # type: (typing.Type[DataType], str) -> typing.Type[HasTraits]
+        return type(self._index_to_subtype_factory[index_class](subtype))
+
+    def _reset_caches(self):
+        self._h5file_for_subclass.clear()
+        self._index_for_subclass.clear()
+        self._subtype_class.cache_clear()
+
+    @staticmethod
+    def _lookup_with_bases(mapping, datatype_class, default):
+        if datatype_class in mapping:
+            return mapping[datatype_class]
+        for base in datatype_class.__bases__:
+            if base in mapping:
+                return mapping[base]
+        return default
 
     def get_h5file_for_datatype(self, datatype_class):
         # type: (typing.Type[HasTraits]) -> typing.Type[H5File]
-        if datatype_class in self._h5file_for_datatype:
-            return self._h5file_for_datatype[datatype_class]
-        for base in datatype_class.__bases__:
-            if base in self._h5file_for_datatype:
-                return self._h5file_for_datatype[base]
-        return H5File
+        h5file_class = self._h5file_for_subclass.get(datatype_class)
+        if h5file_class is None:
+            h5file_class = self._lookup_with_bases(self._h5file_for_datatype, datatype_class, H5File)
+            self._h5file_for_subclass[datatype_class] = h5file_class
+        return h5file_class
 
     def get_base_datatype_for_h5file(self, h5file_class):
         # type: (typing.Type[H5File]) -> typing.Type[HasTraits]
@@ -70,24 +93,22 @@ class Registry(object):
         subtype = h5file.read_subtype_attr()
         if subtype:
             index = self.get_index_for_datatype(base_dt)
-            return type(self._index_to_subtype_factory[index](subtype))
+            return self._subtype_class(index, subtype)
         return base_dt
 
     def get_index_for_datatype(self, datatype_class):
         # type: (typing.Type[HasTraits]) -> typing.Type[DataType]
-        if datatype_class in self._index_for_datatype:
-            return self._index_for_datatype[datatype_class]
-
-        for base in datatype_class.__bases__:
-            if base in self._index_for_datatype:
-                return self._index_for_datatype[base]
-        return DataType
+        index_class = self._index_for_subclass.get(datatype_class)
+        if index_class is None:
+            index_class = self._lookup_with_bases(self._index_for_datatype, datatype_class, DataType)
+            self._index_for_subclass[datatype_class] = index_class
+        return index_class
 
     def get_datatype_for_index(self, index):
         # type: (HasTraitsIndex) -> typing.Type[HasTraits]
         subtype = index.get_subtype_attr()
         if subtype:
-            return type(self._index_to_subtype_factory[type(index)](subtype))
+            return self._subtype_class(type(index), subtype)
         return self._datatype_for_index[type(index)]
 
     def get_h5file_for_index(self, index_class):
@@ -107,3 +128,34 @@ class Registry(object):
         self._datatype_for_index[datatype_index] = datatype_class
         self._index_for_h5file[h5file_class] = datatype_index
         self._index_to_subtype_factory[datatype_index] = subtype_factory
+        self._reset_caches()
+
+    def clear(self):
+        # type: () -> None
+        """
+        Forget every registration, so that the registry can be populated again from scratch.
+        """
+        self._datatype_for_h5file.clear()
+        self._h5file_for_datatype.clear()
+        self._h5file_for_index.clear()
+        self._index_for_datatype.clear()
+        self._datatype_for_index.clear()
+        self._index_for_h5file.clear()
+        self._index_to_subtype_factory.clear()
+        self._reset_caches()
+
+    def register_many(self, registrations):
+        # type: (typing.Iterable[tuple]) -> None
+        """
+        Bulk equivalent of register_datatype, filling each lookup dict with a single update.
+        :param registrations: rows of (datatype_class, h5file_class, datatype_index[, subtype_factory])
+        """
+        rows = [tuple(row) + (None,) * (4 - len(row)) for row in registrations]
+        self._h5file_for_datatype.update((dt, h5) for dt, h5, _, _ in rows)
+        self._h5file_for_index.update((index, h5) for _, h5, index, _ in rows)
+        self._index_for_datatype.update((dt, index) for dt, _, index, _ in rows)
+        self._datatype_for_h5file.update((h5, dt) for dt, h5, _, _ in rows)
+        self._datatype_for_index.update((index, dt) for dt, _, index, _ in rows)
+        self._index_for_h5file.update((h5, index) for _, h5, index, _ in rows)
+        self._index_to_subtype_factory.update((index, factory) for _, _, index, factory in rows)
+        self._reset_caches()
@@ -82,12 +82,19 @@ class Scalar(Accessor):
     Serialized as a global h5 attribute
     """
 
+    def to_metadata(self, val):
+        """
+        Validate val and return what should be written as the h5 attribute, or None if nothing should be written.
+        """
+        # noinspection PyProtectedMember
+        return self.trait_attribute._validate_set(None, val)
+
     def store(self, val):
         # type: (typing.Union[str, int, float]) -> None
-        # noinspection PyProtectedMember
-        val = self.trait_attribute._validate_set(None, val)
+        val = self.to_metadata(val)
         if val is not None:
             self.owner.storage_manager.set_metadata({self.field_name: val})
+            self.owner.metadata_cache = None
 
     def load(self):
         # type: () -> typing.Union[str, int, float]
@@ -102,24 +109,24 @@ class Scalar(Accessor):
 
 
 class Uuid(Scalar):
-    def store(self, val):
-        # type: (uuid.UUID) -> None
+    def to_metadata(self, val):
+        # type: (uuid.UUID) -> typing.Optional[str]
         if val is None and not self.trait_attribute.required:
             # this is an optional reference and it is missing
-            return
-        # noinspection PyProtectedMember
+            return None
         if not isinstance(val, uuid.UUID):
             raise TypeError("expected uuid.UUID got {}".format(type(val)))
         # urn is a standard encoding, that is obvious an uuid
         # str(gid) is more ambiguous
-        self.owner.storage_manager.set_metadata({self.field_name: val.urn})
+        return val.urn
 
     def load(self):
         # type: () -> uuid.UUID
         # TODO: handle inexistent field?
-        metadata = self.owner.storage_manager.get_metadata()
-        if self.field_name in metadata:
-            return uuid.UUID(metadata[self.field_name])
+        if self.owner.metadata_cache is None:
+            self.owner.metadata_cache = self.owner.storage_manager.get_metadata()
+        if self.field_name in self.owner.metadata_cache:
+            return uuid.UUID(self.owner.metadata_cache[self.field_name])
         return None
 
 
@@ -138,10 +145,19 @@ class DataSetMetaData(object):
 
     @classmethod
     def from_array(cls, array):
+        if array.size == 0:
+            return cls(min=None, max=None, mean=None)
         try:
-            return cls(min=array.min(), max=array.max(), mean=array.mean(),
-                       is_finite=numpy.isfinite(array).all().item(),
-                       has_complex=numpy.iscomplex(array).any().item())
+            minimum, maximum = array.min(), array.max()
+            if array.dtype.kind in 'biuf':
+                # NaN and inf propagate into the extremes of real arrays, no need for another pass
+                is_finite = bool(numpy.isfinite(minimum) and numpy.isfinite(maximum))
+            else:
+                is_finite = numpy.isfinite(array).all().item()
+            # only complex dtypes can hold values with a non-zero imaginary part
+            has_complex = numpy.iscomplexobj(array) and numpy.iscomplex(array).any().item()
+            return cls(min=minimum, max=maximum, mean=array.mean(),
+                       is_finite=is_finite, has_complex=has_complex)
         except (TypeError, ValueError):
             # likely a string array
             return cls(min=None, max=None, mean=None)
@@ -291,20 +307,20 @@ class Reference(Uuid):
     Corresponds to a contained datatype
     """
 
-    def store(self, val):
-        # type: (HasTraits) -> None
+    def to_metadata(self, val):
+        # type: (HasTraits) -> typing.Optional[str]
         """
         The reference is stored as a gid in the metadata.
         :param val: a datatype or a uuid.UUID gid
         """
         if val is None and not self.trait_attribute.required:
             # this is an optional reference and it is missing
-            return
+            return None
         if isinstance(val, HasTraits):
             val = val.gid
         if not isinstance(val, uuid.UUID):
             raise TypeError("expected uuid.UUId or HasTraits, got {}".format(type(val)))
-        super(Reference, self).store(val)
+        return super(Reference, self).to_metadata(val)
 
 
 class SparseMatrixMetaData(DataSetMetaData):
@@ -28,6 +28,7 @@
 #
 #
 
+import functools
 import importlib
 import typing
 import os.path
@@ -51,6 +52,18 @@ from tvb.datatypes.equations import Equation
 LOGGER = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _class_from_fqn(class_fqn):
+    # type: (str) -> type
+    """
+    Resolve a fully qualified class name, as stored in H5 metadata, to the class itself.
+    Files of the same type are opened over and over, so the resolution is memoized.
+    """
+    package, cls_name = class_fqn.rsplit('.', 1)
+    module = importlib.import_module(package)
+    return getattr(module, cls_name)
+
+
 class H5File(object):
     """
     A H5 based file format.
@@ -122,6 +135,8 @@ class H5File(object):
 
     def store(self, datatype, scalars_only=False, store_references=True):
         # type: (HasTraits, bool, bool) -> None
+        # plain scalars are root attributes, collect them and write them with a single file open
+        scalar_values = []
         for accessor in self.iter_accessors():
             f_name = accessor.trait_attribute.field_name
             if f_name is None:
@@ -132,7 +147,11 @@ class H5File(object):
                 continue
             if not store_references and isinstance(accessor, Reference):
                 continue
+            if type(accessor) is Scalar:
+                scalar_values.append((accessor, getattr(datatype, f_name)))
+                continue
             accessor.store(getattr(datatype, f_name))
+        self._store_scalars(scalar_values)
 
     def load_into(self, datatype):
         # type: (HasTraits) -> None
@@ -172,23 +191,30 @@ class H5File(object):
     def store_generic_attributes(self, generic_attributes, create=True):
         # type: (GenericAttributes, bool) -> None
         # write_metadata  creation time, serializer class name, etc
-        if create:
-            self.create_date.store(date2string(datetime.now()))
-
         self.generic_attributes.fill_from(generic_attributes)
-        self.invalid.store(self.generic_attributes.invalid)
-        self.is_nan.store(self.generic_attributes.is_nan)
-        self.subject.store(self.generic_attributes.subject)
-        self.state.store(self.generic_attributes.state)
-        self.user_tag_1.store(self.generic_attributes.user_tag_1)
-        self.user_tag_2.store(self.generic_attributes.user_tag_2)
-        self.user_tag_3.store(self.generic_attributes.user_tag_3)
-        self.user_tag_4.store(self.generic_attributes.user_tag_4)
-        self.user_tag_5.store(self.generic_attributes.user_tag_5)
-        self.operation_tag.store(self.generic_attributes.operation_tag)
-        self.visible.store(self.generic_attributes.visible)
+        scalars = [self.invalid, self.is_nan, self.subject, self.state, self.user_tag_1, self.user_tag_2,
+                   self.user_tag_3, self.user_tag_4, self.user_tag_5, self.operation_tag, self.visible]
+        values = [(scalar, getattr(self.generic_attributes, scalar.field_name)) for scalar in scalars]
+        if create:
+            values.insert(0, (self.create_date, date2string(datetime.now())))
         if self.generic_attributes.parent_burst is not None:
-            self.parent_burst.store(uuid.UUID(self.generic_attributes.parent_burst))
+            values.append((self.parent_burst, uuid.UUID(self.generic_attributes.parent_burst)))
+        self._store_scalars(values)
+
+    def _store_scalars(self, values):
+        # type: (typing.List[typing.Tuple[Scalar, typing.Any]]) -> None
+        """
+        Store (scalar accessor, value) pairs like Scalar.store would, but with a single metadata write,
+        as all of them are root attributes.
+        """
+        metadata = {}
+        for scalar, value in values:
+            value = scalar.to_metadata(value)
+            if value is not None:
+                metadata[scalar.field_name] = value
+        if metadata:
+            self.storage_manager.set_metadata(metadata)
+            self.metadata_cache = None
 
     def load_generic_attributes(self):
         # type: () -> GenericAttributes
@@ -233,10 +259,7 @@ class H5File(object):
 
     def determine_datatype_from_file(self):
         config_type = self.type.load()
-        package, cls_name = config_type.rsplit('.', 1)
-        module = importlib.import_module(package)
-        datatype_cls = getattr(module, cls_name)
-        return datatype_cls
+        return _class_from_fqn(config_type)
 
     @staticmethod
     def determine_type(path):
@@ -244,10 +267,7 @@ class H5File(object):
         type_class_fqn = H5File.get_metadata_param(path, 'type')
         if type_class_fqn is None:
             return HasTraits
-        package, cls_name = type_class_fqn.rsplit('.', 1)
-        module = importlib.import_module(package)
-        cls = getattr(module, cls_name)
-        return cls
+        return _class_from_fqn(type_class_fqn)
 
     @staticmethod
     def get_metadata_param(path, param):
@@ -262,10 +282,7 @@ class H5File(object):
         h5file_class_fqn = H5File.get_metadata_param(path, H5File.KEY_WRITTEN_BY)
         if h5file_class_fqn is None:
             return H5File(path)
-        package, cls_name = h5file_class_fqn.rsplit('.', 1)
-        module = importlib.import_module(package)
-        cls = getattr(module, cls_name)
-        return cls
+        return _class_from_fqn(h5file_class_fqn)
 
     @staticmethod
     def from_file(path):
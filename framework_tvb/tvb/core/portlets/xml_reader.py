@@ -33,6 +33,7 @@
 .. moduleauthor:: bogdan.neacsa <bogdan.neacsa@codemart.ro>
 """
 
+import ast
 import xml.dom.minidom
 from xml.dom.minidom import Node
 from tvb.basic.logger.builder import get_logger
@@ -125,7 +126,7 @@ class XMLPortletReader(object):
             input_ = self._read_all_attributes(node)
             req = node.getAttribute(ATT_REQUIRED)
             if req is not None and len(str(req)) > 0:
-                input_[ATT_REQUIRED] = eval(req)
+                input_[ATT_REQUIRED] = ast.literal_eval(req)
             if len(node.childNodes) > 0:
                 for child_node in node.childNodes:
                     if child_node.nodeType != Node.ELEMENT_NODE:
@@ -124,9 +124,7 @@ class AlgorithmService(object):
         """
         For a list of dataType IDs and a project id create all the required links.
         """
-        for data in data_ids:
-            link = Links(data, project_id)
-            dao.store_entity(link)
+        dao.store_entities([Links(data, project_id) for data in data_ids])
 
     @staticmethod
     def remove_link(dt_id, project_id):
@@ -266,6 +266,7 @@ class ImportService(object):
     def _retrieve_operations_in_order(self, project, import_path):
         # type: (Project, str) -> list[Operation2ImportData]
         retrieved_operations = []
+        importer_algorithm = None
 
         for root, _, files in os.walk(import_path):
             if OPERATION_XML in files:
@@ -312,7 +313,9 @@ class ImportService(object):
                         Operation2ImportData(operation, root, main_view_model, dt_paths, all_view_model_files))
 
                 elif len(dt_paths) > 0:
-                    alg = dao.get_algorithm_by_module(TVB_IMPORTER_MODULE, TVB_IMPORTER_CLASS)
+                    if importer_algorithm is None:
+                        importer_algorithm = dao.get_algorithm_by_module(TVB_IMPORTER_MODULE, TVB_IMPORTER_CLASS)
+                    alg = importer_algorithm
                     default_adapter = ABCAdapter.build_adapter(alg)
                     view_model = default_adapter.get_view_model_class()()
                     view_model.data_file = dt_paths[0]
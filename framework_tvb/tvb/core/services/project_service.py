@@ -455,13 +455,14 @@ class ProjectService:
         """
         metadata_list = []
         dt_list = dao.get_data_in_project(project.id, visibility_filter, filter_value)
+        dt_entities = dao.get_datatypes_by_gids([dt.gid for dt in dt_list])
 
         for dt in dt_list:
             # Prepare the DT results from DB, for usage in controller, by converting into DataTypeMetaData objects
             data = {}
             is_group = False
             group_op = None
-            dt_entity = dao.get_datatype_by_gid(dt.gid)
+            dt_entity = dt_entities.get(dt.gid)
             if dt_entity is None:
                 self.logger.warning("Ignored entity (possibly removed DT class)" + str(dt))
                 continue
@@ -33,6 +33,7 @@
 """
 
 import os
+import re
 import sys
 import json
 import datetime
@@ -52,11 +53,22 @@ CHAR_SEPARATOR = "__"
 CHAR_SPACE = "--"
 CHAR_DRIVE = "-DriVe-"
 DRIVE_SEP = ":"
+# all three substitutions of path2url_part done in a single pass over the path
+_PATH2URL_TABLE = str.maketrans({os.sep: CHAR_SEPARATOR, " ": CHAR_SPACE, DRIVE_SEP: CHAR_DRIVE})
 COMPLEX_TIME_FORMAT = '%Y-%m-%d,%H-%M-%S.%f'
 # LESS_COMPLEX_TIME_FORMAT is also compatible with data exported from TVB 1.0. 
 # This is only used as a fallback in the string to date conversion.
 LESS_COMPLEX_TIME_FORMAT = '%Y-%m-%d,%H-%M-%S'
 SIMPLE_TIME_FORMAT = "%m-%d-%Y"
+# Exact layouts of the formats that datetime.fromisoformat can parse much faster than strptime.
+# fromisoformat accepts far more than these formats, so it is only used on strings matching them exactly.
+_ISO_DATE_TIME = r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+_ISO_LAYOUTS = {
+    '%Y-%m-%d %H:%M:%S.%f': re.compile(_ISO_DATE_TIME + r' [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{1,6}'),
+    '%Y-%m-%d %H:%M:%S': re.compile(_ISO_DATE_TIME + r' [0-9]{2}:[0-9]{2}:[0-9]{2}'),
+}
+# COMPLEX_TIME_FORMAT and LESS_COMPLEX_TIME_FORMAT, which only differ from ISO 8601 by their time separators
+_COMPLEX_LAYOUT = re.compile(_ISO_DATE_TIME + r',[0-9]{2}-[0-9]{2}-[0-9]{2}(\.[0-9]{1,6})?')
 
 
 ################## PATH related methods start here ###############
@@ -67,7 +79,7 @@ def path2url_part(file_path):
     """
     if not os.path.isabs(file_path):
         file_path = os.path.join(TvbProfile.current.TVB_STORAGE, file_path)
-    result = file_path.replace(os.sep, CHAR_SEPARATOR).replace(" ", CHAR_SPACE).replace(DRIVE_SEP, CHAR_DRIVE)
+    result = file_path.translate(_PATH2URL_TABLE)
     return urllib.parse.quote(result)
 
 
@@ -85,8 +97,7 @@ def get_unique_file_name(storage_folder, file_name, try_number=0):
     """
     # TODO this method should be re-tought
     name, ext = os.path.splitext(file_name)
-    date = str(datetime.datetime.now())
-    date = date.replace(' ', '').replace(':', '').replace('.', '').replace('-', '')
+    date = datetime.datetime.now().strftime('%Y%m%d%H%M%S%f')
     if try_number > 0:
         file_ = '%s-%s%s' % (name, date, ext)
     else:
@@ -119,8 +130,19 @@ def string2date(string_input, complex_format=True, date_format=None):
     if string_input is 'None':
         return None
     if date_format is not None:
+        layout = _ISO_LAYOUTS.get(date_format)
+        if layout is not None and layout.fullmatch(string_input):
+            try:
+                return datetime.datetime.fromisoformat(string_input)
+            except ValueError:
+                pass
         return datetime.datetime.strptime(string_input, date_format)
     if complex_format:
+        if _COMPLEX_LAYOUT.fullmatch(string_input):
+            try:
+                return datetime.datetime.fromisoformat(string_input[:11] + string_input[11:].replace('-', ':'))
+            except ValueError:
+                pass
         try:
             return datetime.datetime.strptime(string_input, COMPLEX_TIME_FORMAT)
         except ValueError:
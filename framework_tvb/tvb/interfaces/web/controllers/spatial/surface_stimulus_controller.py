@@ -262,7 +262,7 @@ class SurfaceStimulusController(SpatioTemporalController):
         """
         current_surface_stim = common.get_from_session(KEY_SURFACE_STIMULI)
         submited_focal_points = kwargs['defined_focal_points']
-        current_surface_stim.focal_points_triangles = numpy.array(json.loads(submited_focal_points))
+        current_surface_stim.focal_points_triangles = numpy.array(json.loads(submited_focal_points), dtype=int)
         return self.do_step(next_step, 2)
 
     def create_stimulus(self):
@@ -325,7 +325,7 @@ class SurfaceStimulusController(SpatioTemporalController):
         """
         try:
             current_surface_stim = common.get_from_session(KEY_SURFACE_STIMULI)
-            current_surface_stim.focal_points_triangles = numpy.array(json.loads(focal_points))
+            current_surface_stim.focal_points_triangles = numpy.array(json.loads(focal_points), dtype=int)
             min_time = common.get_from_session(KEY_TMP_FORM).min_tmp_x.value or 0
             max_time = common.get_from_session(KEY_TMP_FORM).max_tmp_x.value or 100
 
@@ -41,6 +41,7 @@ import tvb.core.entities.file.hdf5_storage_manager as hdf5
 from tvb.basic.profile import TvbProfile
 from tvb.core.entities.file.exceptions import FileStructureException, MissingDataSetException
 from tvb.core.entities.file.exceptions import IncompatibleFileManagerException
+from tvb.core.neotraits.h5 import STORE_STRING
 
 # Some constants used by tests
 STORAGE_FILE_NAME = "test_data.h5"
@@ -155,6 +156,36 @@ class TestHDF5Storage(object):
         read_data = self.storage.get_data(DATASET_NAME_1)
         self._assert_arrays_are_equal(self.test_string_array, read_data)
 
+    def test_variable_length_string_data_storage(self):
+        """
+        Test that variable length UTF-8 strings are read back as strings, not bytes
+        """
+        labels = numpy.array(["Left-Amygdala", "rHC"]).astype(STORE_STRING)
+        self.storage.store_data(DATASET_NAME_1, labels)
+        read_data = self.storage.get_data(DATASET_NAME_1)
+        self._assert_arrays_are_equal(numpy.array(["Left-Amygdala", "rHC"]), read_data)
+        assert isinstance(read_data[0], str)
+        assert isinstance(self.storage.get_data(DATASET_NAME_1, (slice(1, 2),))[0], str)
+
+    def test_variable_length_string_data_with_empty_first_label(self):
+        """
+        Test that decoding depends on the dataset type, not on the first value read
+        """
+        labels = numpy.array(["", "rHC"]).astype(STORE_STRING)
+        self.storage.store_data(DATASET_NAME_1, labels)
+        read_data = self.storage.get_data(DATASET_NAME_1)
+        self._assert_arrays_are_equal(numpy.array(["", "rHC"]), read_data)
+        assert read_data.dtype.kind == 'U'
+
+    def test_fixed_length_string_data_is_not_decoded(self):
+        """
+        Test that only variable length string datasets are decoded, fixed length ones keep returning bytes
+        """
+        self.storage.store_data(DATASET_NAME_1, self.test_string_array)
+        read_data = self.storage.get_data(DATASET_NAME_1)
+        assert read_data.dtype.kind == 'S'
+        assert isinstance(read_data[0, 0], bytes)
+
     def test_store_none_data(self):
         """
         Test scenario when trying to store None data
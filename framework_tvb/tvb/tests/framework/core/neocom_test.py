@@ -27,7 +27,9 @@
 #   Frontiers in Neuroinformatics (7:10. doi: 10.3389/fninf.2013.00010)
 #
 #
+import importlib
 import os
+import sys
 
 import numpy
 from tvb.core.entities.file.files_helper import FilesHelper
@@ -120,3 +122,67 @@ def test_store_simulator_view_model_eeg(connectivity_index_factory, surface_inde
     assert isinstance(sim_view_model, SimulatorAdapterModel)
     assert isinstance(loaded_sim_view_model, SimulatorAdapterModel)
     assert sim_view_model.monitors[0].projection == loaded_sim_view_model.monitors[0].projection
+
+
+def test_registry_register_many_matches_register_datatype():
+    from tvb.adapters.datatypes.db.connectivity import ConnectivityIndex
+    from tvb.adapters.datatypes.h5.connectivity_h5 import ConnectivityH5
+    from tvb.core.neocom._registry import Registry
+    from tvb.datatypes.connectivity import Connectivity
+
+    single, bulk = Registry(), Registry()
+    single.register_datatype(Connectivity, ConnectivityH5, ConnectivityIndex)
+    bulk.register_many([(Connectivity, ConnectivityH5, ConnectivityIndex)])
+
+    assert bulk.get_h5file_for_datatype(Connectivity) is single.get_h5file_for_datatype(Connectivity)
+    assert bulk.get_index_for_datatype(Connectivity) is single.get_index_for_datatype(Connectivity)
+    assert bulk.get_datatype_for_index(ConnectivityIndex()) is single.get_datatype_for_index(ConnectivityIndex())
+
+
+def test_populate_datatypes_registry_is_idempotent():
+    from tvb.config.init.datatypes_registry import populate_datatypes_registry
+    from tvb.datatypes.connectivity import Connectivity
+
+    populate_datatypes_registry()
+    h5file_class = h5.REGISTRY.get_h5file_for_datatype(Connectivity)
+    populate_datatypes_registry()
+    assert h5.REGISTRY.get_h5file_for_datatype(Connectivity) is h5file_class
+
+
+def test_registry_subtype_class_is_resolved_once():
+    from tvb.adapters.datatypes.db.surface import SurfaceIndex
+    from tvb.datatypes.surfaces import CorticalSurface, CORTICAL
+    surface_index = SurfaceIndex()
+    surface_index.surface_type = CORTICAL
+
+    assert h5.REGISTRY.get_datatype_for_index(surface_index) is CorticalSurface
+    hits = h5.REGISTRY._subtype_class.cache_info().hits
+    assert h5.REGISTRY.get_datatype_for_index(surface_index) is CorticalSurface
+    assert h5.REGISTRY._subtype_class.cache_info().hits == hits + 1
+
+
+def test_registry_subclass_lookup_follows_later_registrations():
+    from tvb.adapters.datatypes.db.connectivity import ConnectivityIndex
+    from tvb.adapters.datatypes.h5.connectivity_h5 import ConnectivityH5
+    from tvb.core.neocom._registry import Registry
+    from tvb.core.neotraits.h5 import H5File
+    from tvb.datatypes.connectivity import Connectivity
+
+    class SubConnectivity(Connectivity):
+        pass
+
+    registry = Registry()
+    assert registry.get_h5file_for_datatype(SubConnectivity) is H5File
+    registry.register_datatype(Connectivity, ConnectivityH5, ConnectivityIndex)
+    assert registry.get_h5file_for_datatype(SubConnectivity) is ConnectivityH5
+    assert registry.get_index_for_datatype(SubConnectivity) is ConnectivityIndex
+
+
+def test_import_datatypes_registry_has_no_side_effects(monkeypatch):
+    module_name = 'tvb.config.init.datatypes_registry'
+    monkeypatch.delitem(sys.modules, module_name)
+    monkeypatch.delitem(sys.modules, 'tvb.config.init._registrations', raising=False)
+    modules_before = set(sys.modules)
+
+    importlib.import_module(module_name)
+    assert set(sys.modules) - modules_before == {module_name}
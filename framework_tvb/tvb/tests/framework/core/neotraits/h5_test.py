@@ -28,10 +28,12 @@
 #
 #
 
+import uuid
 import numpy
-from tvb.basic.neotraits.api import Attr, NArray
+from tvb.basic.neotraits.api import HasTraits, Attr, NArray, Int, Float
+from tvb.core.entities.generic_attributes import GenericAttributes
 from .data import FooDatatype, BarDatatype, BazDataType, PropsDataType
-from tvb.core.neotraits.h5 import H5File, DataSet, Scalar, Reference
+from tvb.core.neotraits.h5 import H5File, DataSet, DataSetMetaData, Scalar, Reference
 
 
 
@@ -100,6 +102,51 @@ def test_simple_store_load(tmph5factory):
     assert numpy.all(ret.miu == [0.0, 1.0, 2.0])
 
 
+class ScalarsDataType(HasTraits):
+    scalar_int = Int()
+    scalar_float = Float()
+    scalar_str = Attr(str)
+    scalar_optional = Attr(str, required=False)
+
+
+class ScalarsFile(H5File):
+    def __init__(self, path):
+        super(ScalarsFile, self).__init__(path)
+        self.scalar_int = Scalar(ScalarsDataType.scalar_int, self)
+        self.scalar_float = Scalar(ScalarsDataType.scalar_float, self)
+        self.scalar_str = Scalar(ScalarsDataType.scalar_str, self)
+        self.scalar_optional = Scalar(ScalarsDataType.scalar_optional, self)
+
+
+def test_store_writes_scalars_at_once(tmph5factory):
+    datatype = ScalarsDataType(scalar_int=4, scalar_float=0.5, scalar_str='topol')
+    path = tmph5factory()
+    scalar_names = {'scalar_int', 'scalar_float', 'scalar_str', 'scalar_optional'}
+
+    with ScalarsFile(path) as f:
+        written = []
+        set_metadata = f.storage_manager.set_metadata
+
+        def recording_set_metadata(meta_dictionary, *args, **kwargs):
+            written.append(set(meta_dictionary))
+            set_metadata(meta_dictionary, *args, **kwargs)
+
+        f.storage_manager.set_metadata = recording_set_metadata
+        f.store(datatype)
+
+    scalar_writes = [keys for keys in written if keys & scalar_names]
+    assert scalar_writes == [{'scalar_int', 'scalar_float', 'scalar_str'}]
+
+    ret = ScalarsDataType()
+    with ScalarsFile(path) as f:
+        f.load_into(ret)
+    assert ret.scalar_int == 4
+    assert ret.scalar_float == 0.5
+    assert ret.scalar_str == 'topol'
+    assert ret.scalar_optional is None
+    assert ret.gid == datatype.gid
+
+
 def test_dataset_metadata(tmph5factory):
     baz = BazDataType(miu=numpy.array([0.0, 1.0, 2.0]), scalar_str='topol')
     path = tmph5factory()
@@ -111,6 +158,11 @@ def test_dataset_metadata(tmph5factory):
         assert f.miu.get_cached_metadata().max == 2.0
 
 
+def test_dataset_metadata_empty_array():
+    meta = DataSetMetaData.from_array(numpy.zeros((0, 3)))
+    assert meta.min is None and meta.max is None and meta.mean is None
+
+
 
 def test_aggregate_store(tmph5factory, fooFactory):
     foo = fooFactory()
@@ -209,3 +261,20 @@ def test_props_datatype_file(tmph5factory):
 
     with PropsDataTypeFile(path) as f:
         f.load_into(ret)
+
+
+def test_generic_attributes_store_load(tmph5factory):
+    generic_attributes = GenericAttributes()
+    generic_attributes.subject = 'John Doe'
+    generic_attributes.user_tag_2 = 'tag'
+    generic_attributes.parent_burst = uuid.uuid4().hex
+
+    with BazFile(tmph5factory()) as f:
+        f.store_generic_attributes(generic_attributes)
+        loaded = f.load_generic_attributes()
+
+    assert loaded.subject == 'John Doe'
+    assert loaded.user_tag_2 == 'tag'
+    assert loaded.parent_burst == generic_attributes.parent_burst
+    assert loaded.visible and not loaded.invalid
+    assert loaded.create_date is not None
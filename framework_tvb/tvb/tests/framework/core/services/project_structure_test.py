@@ -287,6 +287,39 @@ class TestProjectStructure(TransactionalTestCase):
         assert len(inputs) == 1, "Incorrect number of inputs."
         assert conn.id == inputs[0].id, "Retrieved wrong input dataType."
 
+    def test_get_datatypes_by_gids(self, array_factory):
+        """
+        Tests that several datatypes are retrieved at once, as their specific index classes.
+        """
+        array_wrappers = array_factory(self.test_project)
+        dt_list = [dao.get_datatype_by_id(array_wrapper[0]) for array_wrapper in array_wrappers]
+        gids = [dt.gid for dt in dt_list]
+
+        found = dao.get_datatypes_by_gids(gids + ["inexistent_gid"])
+        assert set(gids) == set(found.keys()), "Only the stored datatypes should be returned."
+        for gid in gids:
+            single = dao.get_datatype_by_gid(gid)
+            assert type(single) is type(found[gid])
+            assert single.id == found[gid].id
+
+        assert {} == dao.get_datatypes_by_gids([])
+
+    def test_get_datatypes_by_gids_unresolvable_class(self, array_factory, dummy_datatype_index_factory):
+        """
+        Tests that a DataType class which can not be imported only hides its own datatypes.
+        """
+        broken_dt = dummy_datatype_index_factory(project=self.test_project)
+        broken_dt.module = "tvb.tests.framework.inexistent_module"
+        # lowest gid, so that the broken class is looked up before the valid one
+        broken_dt.gid = "0" * 32
+        broken_dt = dao.store_entity(broken_dt)
+
+        array_wrappers = array_factory(self.test_project)
+        gids = [dao.get_datatype_by_id(array_wrapper[0]).gid for array_wrapper in array_wrappers]
+
+        found = dao.get_datatypes_by_gids([broken_dt.gid] + gids)
+        assert set(gids) == set(found.keys()), "Datatypes of the valid class should still be returned."
+
     def test_remove_datatype(self, array_factory):
         """
         Tests the deletion of a datatype.
@@ -38,7 +38,7 @@ import os
 import pytest
 import datetime
 from tvb.tests.framework.core.base_testcase import TransactionalTestCase
-from tvb.core.utils import path2url_part, get_unique_file_name, string2date, date2string, string2bool
+from tvb.core.utils import path2url_part, url2path, get_unique_file_name, string2date, date2string, string2bool
 
 
 class TestUtils(TransactionalTestCase):
@@ -55,6 +55,14 @@ class TestUtils(TransactionalTestCase):
         assert not ' ' in processed_path, "Invalid character ' ' should have beed removed"
         assert not ':' in processed_path, "Invalid character ':' should have beed removed"
 
+    def test_path2url_part_roundtrip(self):
+        """
+        Test that url2path restores the path encoded by path2url_part.
+        """
+        file_path = os.path.join(os.sep + "some folder", "C:sub", "file name.h5")
+        processed_path = path2url_part(file_path)
+        assert url2path(processed_path) == file_path
+
     def test_get_unique_file_name(self):
         """
         Test that we get unique file names no matter if we pass the same folder as input.
@@ -93,6 +101,18 @@ class TestUtils(TransactionalTestCase):
         assert custom_date == datetime.datetime(1999, 1, 1),\
                          "Did not get expected datetime from conversion object."
 
+    def test_string2date_roundtrip(self):
+        """
+        Check that dates written with the default and ISO like formats are read back unchanged.
+        """
+        date_input = datetime.datetime(1999, 3, 16, 18, 20, 33, 123456)
+        assert string2date(date2string(date_input)) == date_input
+        assert string2date(date2string(date_input.replace(microsecond=0))) == date_input.replace(microsecond=0)
+        iso_format = '%Y-%m-%d %H:%M:%S.%f'
+        assert string2date(date2string(date_input, date_format=iso_format), date_format=iso_format) == date_input
+        assert string2date("1999-3-16 18:20:33.1", date_format=iso_format) == datetime.datetime(1999, 3, 16, 18,
+                                                                                              20, 33, 100000)
+
     def test_string2date_invalid(self):
         """
         Check that a ValueError is raised in case some invalid date is passed.
@@ -100,6 +120,21 @@ class TestUtils(TransactionalTestCase):
         with pytest.raises(ValueError):
             string2date("somethinginvalid")
 
+    @pytest.mark.parametrize("string_input, date_format", [
+        ("1999-03-16", '%Y-%m-%d %H:%M:%S.%f'),
+        ("1999-03-16 18:20:33.5+05:00", '%Y-%m-%d %H:%M:%S.%f'),
+        ("19990316T182033", '%Y-%m-%d %H:%M:%S'),
+        ("1999-03-16T18:20:33", '%Y-%m-%d %H:%M:%S'),
+        ("1999-03-16,18-20", None),
+        ("1999-03-16,18-20-33-05", None),
+        ("1999-03-16,18-20-33.5+05-00", None)])
+    def test_string2date_rejects_other_iso_layouts(self, string_input, date_format):
+        """
+        Strings that ISO parsing would accept, but which do not match the requested format, are still refused.
+        """
+        with pytest.raises(ValueError):
+            string2date(string_input, date_format=date_format)
+
     def test_date2string(self):
         """
         Check the date2string method for various inputs.
@@ -367,7 +367,7 @@ class EpileptorRestingState(ModelNumbaDfun):
         return deriv.T[..., numpy.newaxis]
 
 
-@guvectorize([(float64[:],) * 31], '(n),(m)' + ',()' * 28 + '->(n)', nopython=True)
+@guvectorize([(float64[:],) * 31], '(n),(m)' + ',()' * 28 + '->(n)', nopython=True, cache=True)
 def _numba_dfun(y, c_pop,
                 x0, Iext, Iext2, a, b, slope, tt, Kvf, c, d, r, Ks, Kf, aa, bb, tau,
                 tau_rs, I_rs, a_rs, b_rs, d_rs, e_rs, f_rs, beta_rs, alpha_rs, gamma_rs, K_rs, lc_1,
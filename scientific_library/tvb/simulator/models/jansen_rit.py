@@ -275,7 +275,7 @@ class JansenRit(ModelNumbaDfun):
         return deriv.T[..., numpy.newaxis]
 
 
-@guvectorize([(float64[:],) * 17], '(n),(m)' + ',()'*14 + '->(n)', nopython=True)
+@guvectorize([(float64[:],) * 17], '(n),(m)' + ',()'*14 + '->(n)', nopython=True, cache=True)
 def _numba_dfun_jr(y, c,
                    src,
                    nu_max, r, v0, a, a_1, a_2, a_3, a_4, A, b, B, J, mu,
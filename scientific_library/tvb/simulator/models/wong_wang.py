@@ -37,11 +37,12 @@ from numba import guvectorize, float64
 from tvb.basic.neotraits.api import NArray, Final, List, Range
 
 
-@guvectorize([(float64[:],)*11], '(n),(m)' + ',()'*8 + '->(n)', nopython=True)
+@guvectorize([(float64[:],)*11], '(n),(m)' + ',()'*8 + '->(n)', nopython=True, cache=True)
 def _numba_dfun(S, c, a, b, d, g, ts, w, j, io, dx):
     "Gufunc for reduced Wong-Wang model equations."
     x = w[0]*j[0]*S[0] + io[0] + j[0]*c[0]
-    h = (a[0]*x - b[0]) / (1 - numpy.exp(-d[0]*(a[0]*x - b[0])))
+    u = a[0]*x - b[0]
+    h = u / -numpy.expm1(-d[0]*u)
     dx[0] = - (S[0] / ts[0]) + (1.0 - S[0]) * h * g[0]
 
 
@@ -160,7 +161,8 @@ class ReducedWongWang(ModelNumbaDfun):
         lc_0 = local_coupling * S
 
         x  = self.w * self.J_N * S + self.I_o + self.J_N * c_0 + self.J_N * lc_0
-        H = (self.a * x - self.b) / (1 - numpy.exp(-self.d * (self.a * x - self.b)))
+        u = self.a * x - self.b
+        H = u / -numpy.expm1(-self.d * u)
         dS = - (S / self.tau_s) + (1 - S) * H * self.gamma
 
         derivative = numpy.array([dS])
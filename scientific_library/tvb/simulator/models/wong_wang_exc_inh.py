@@ -40,7 +40,7 @@ from tvb.basic.neotraits.api import NArray, Final, List, Range
 from tvb.simulator.models.base import ModelNumbaDfun
 
 
-@guvectorize([(float64[:],)*21], '(n),(m)' + ',()'*18 + '->(n)', nopython=True)
+@guvectorize([(float64[:],)*21], '(n),(m)' + ',()'*18 + '->(n)', nopython=True, cache=True)
 def _numba_dfun(S, c, ae, be, de, ge, te, wp, we, jn, ai, bi, di, gi, ti, wi, ji, g, l, io, dx):
     "Gufunc for reduced Wong-Wang model equations."
 
@@ -50,12 +50,12 @@ def _numba_dfun(S, c, ae, be, de, ge, te, wp, we, jn, ai, bi, di, gi, ti, wi, ji
 
     x = wp[0]*jnSe - ji[0]*S[1] + we[0]*io[0] + cc
     x = ae[0]*x - be[0]
-    h = x / (1 - numpy.exp(-de[0]*x))
+    h = x / -numpy.expm1(-de[0]*x)
     dx[0] = - (S[0] / te[0]) + (1.0 - S[0]) * h * ge[0]
 
     x = jnSe - S[1] + wi[0]*io[0] + l[0]*cc
     x = ai[0]*x - bi[0]
-    h = x / (1 - numpy.exp(-di[0]*x))
+    h = x / -numpy.expm1(-di[0]*x)
     dx[1] = - (S[1] / ti[0]) + h * gi[0]
 
 
@@ -240,14 +240,14 @@ class ReducedWongWangExcInh(ModelNumbaDfun):
         x_e = self.w_p * J_N_S_e - self.J_i * S[1] + self.W_e * self.I_o + coupling
 
         x_e = self.a_e * x_e - self.b_e
-        H_e = x_e / (1 - numpy.exp(-self.d_e * x_e))
+        H_e = x_e / -numpy.expm1(-self.d_e * x_e)
 
         dS_e = - (S[0] / self.tau_e) + (1 - S[0]) * H_e * self.gamma_e
 
         x_i = J_N_S_e - S[1] + self.W_i * self.I_o + self.lamda * coupling
 
         x_i = self.a_i * x_i - self.b_i
-        H_i = x_i / (1 - numpy.exp(-self.d_i * x_i))
+        H_i = x_i / -numpy.expm1(-self.d_i * x_i)
 
         dS_i = - (S[1] / self.tau_i) + H_i * self.gamma_i
 
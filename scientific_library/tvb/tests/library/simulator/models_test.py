@@ -35,6 +35,7 @@ Test for tvb.simulator.models module
 
 """
 
+import decimal
 from tvb.tests.library.base_testcase import BaseTestCase
 from tvb.basic.neotraits.api import Final, List
 from tvb.simulator import models
@@ -203,6 +204,54 @@ class TestModels(BaseTestCase):
         model = models.ReducedWongWang()
         self._validate_initialization(model, 1)
 
+    def test_reduced_wong_wang_numpy_dfun(self):
+        """
+        The numpy fallback should agree with the numba dfun
+        """
+        model = models.ReducedWongWang()
+        model.configure()
+        state = numpy.random.uniform(0.0, 1.0, (1, 10, 1))
+        coupling = numpy.random.uniform(0.0, 0.1, (1, 10, 1))
+        numba_deriv = model.dfun(state, coupling, local_coupling=0.2)
+        numpy_deriv = model._numpy_dfun(state, coupling, local_coupling=0.2)
+        numpy.testing.assert_allclose(numba_deriv, numpy_deriv)
+
+    @staticmethod
+    def _wong_wang_rate(u, d, gamma):
+        """
+        gamma * u / (1 - exp(-d * u)), evaluated with 50 significant digits
+        """
+        with decimal.localcontext() as ctx:
+            ctx.prec = 50
+            u, d, gamma = decimal.Decimal(float(u)), decimal.Decimal(float(d)), decimal.Decimal(float(gamma))
+            return float(gamma * u / (1 - (-d * u).exp()))
+
+    def test_wong_wang_rate_near_threshold(self):
+        """
+        With S = 0 and no coupling the derivative is just gamma * H(x). When a*x - b is close to 0,
+        1 - exp(-d*(a*x - b)) suffers from cancellation, so check H against a high precision reference there.
+        """
+        for delta in [1e-6, 1e-8, 1e-10, 1e-12, -1e-10]:
+            model = models.ReducedWongWang()
+            model.I_o = model.b / model.a + delta
+            model.configure()
+            state = numpy.zeros((1, 1, 1))
+            # x is exactly I_o here
+            u = model.a[0] * model.I_o[0] - model.b[0]
+            expected = self._wong_wang_rate(u, model.d[0], model.gamma[0])
+            numpy.testing.assert_allclose(model.dfun(state, state).flat, expected, rtol=1e-12)
+            numpy.testing.assert_allclose(model._numpy_dfun(state, state).flat, expected, rtol=1e-12)
+
+            model = models.ReducedWongWangExcInh()
+            model.I_o = model.b_e / (model.a_e * model.W_e) + delta
+            model.configure()
+            state = numpy.zeros((2, 1, 1))
+            # the excitatory x is exactly W_e * I_o here
+            u = model.a_e[0] * (model.W_e[0] * model.I_o[0]) - model.b_e[0]
+            expected = self._wong_wang_rate(u, model.d_e[0], model.gamma_e[0])
+            numpy.testing.assert_allclose(model.dfun(state, state[:1])[0].flat, expected, rtol=1e-12)
+            numpy.testing.assert_allclose(model._numpy_dfun(state, state[:1])[0].flat, expected, rtol=1e-12)
+
     def test_zetterberg_jansen(self):
         """
         """